@@ -0,0 +1,118 @@
+import heapq
+import math
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, Optional
+
+from text_normalizer import tokenize
+
+
+class BM25Index:
+    """
+    In-process BM25 full-text index over the recipe documents. It is used
+    as a fallback for setups where the MongoDB text index is not
+    available. Field weights work the same way as the text index weights:
+    a term found in a field counts `weight` times.
+    """
+
+    def __init__(self, weights: Dict[str, int], k1: float = 1.5, b: float = 0.75):
+        """
+        Initializes an empty BM25 index.
+
+        :param weights: Dictionary of field names and their weights.
+        :param k1: Term frequency saturation parameter.
+        :param b: Document length normalization parameter.
+        """
+        self.weights = weights
+        self.k1 = k1
+        self.b = b
+        self.documents: List[dict] = []
+        self.lengths: List[float] = []
+        self.postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+
+    @classmethod
+    def from_cursor(cls, cursor: Iterable[dict], weights: Dict[str, int]) -> "BM25Index":
+        """
+        Builds the index from a cursor (or any iterable) of recipe documents.
+
+        :param cursor: Documents to index.
+        :param weights: Dictionary of field names and their weights.
+        :return: The built index.
+        """
+        index = cls(weights)
+        for document in cursor:
+            index.add(document)
+        return index
+
+    @staticmethod
+    def field_text(value) -> str:
+        """
+        Flattens a field value into a single string. Lists (ingredients)
+        and dictionaries (preparation steps) are joined by their values.
+
+        :param value: Field value of a document.
+        :return: The text of the field.
+        """
+        if isinstance(value, dict):
+            return " ".join(str(item) for item in value.values())
+        if isinstance(value, list):
+            return " ".join(str(item) for item in value)
+        return str(value) if value is not None else ""
+
+    def add(self, document: dict) -> None:
+        """
+        Adds a single document to the index. Only the `_id`, `title` and
+        `link` of the document are kept in memory.
+
+        :param document: A dictionary representing the document.
+        """
+        doc_id = len(self.documents)
+        frequencies = Counter()
+        for field, weight in self.weights.items():
+            for token in tokenize(self.field_text(document.get(field))):
+                frequencies[token] += weight
+
+        for token, frequency in frequencies.items():
+            self.postings[token][doc_id] = frequency
+        self.lengths.append(sum(frequencies.values()))
+        self.documents.append(
+            {
+                "_id": document.get("_id"),
+                "title": document.get("title"),
+                "link": document.get("link"),
+            }
+        )
+
+    def search(self, query: str, page: int = 1, page_size: int = 10) -> List[dict]:
+        """
+        Ranks the indexed documents against the query with BM25.
+
+        :param query: The search text.
+        :param page: Page number, starting from 1.
+        :param page_size: Number of results per page.
+        :return: A list of documents with their `score`, best match first.
+        :raises ValueError: If `page` or `page_size` is less than 1.
+        """
+        if page < 1 or page_size < 1:
+            raise ValueError("page and page_size must be at least 1")
+
+        count = len(self.documents)
+        if count == 0:
+            return []
+        avg_length = sum(self.lengths) / count or 1
+
+        scores: Dict[int, float] = defaultdict(float)
+        for token in set(tokenize(query)):
+            postings: Optional[Dict[int, float]] = self.postings.get(token)
+            if not postings:
+                continue
+            idf = math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for doc_id, frequency in postings.items():
+                norm = self.k1 * (1 - self.b + self.b * self.lengths[doc_id] / avg_length)
+                scores[doc_id] += idf * frequency * (self.k1 + 1) / (frequency + norm)
+
+        start = (page - 1) * page_size
+        ranked = heapq.nlargest(start + page_size, scores.items(), key=lambda item: item[1])
+        return [
+            {**self.documents[doc_id], "score": score}
+            for doc_id, score in ranked[start:start + page_size]
+        ]
@@ -1,10 +1,165 @@
 from database.database_config import MongoDB
-from pymongo import errors
+from database.bm25_index import BM25Index
+from pymongo import errors, TEXT
+
+
+SEARCH_WEIGHTS = {
+    "title": 10,
+    "ingredients": 5,
+    "description": 3,
+    "preparation Texts": 1,
+}
+
+# Pipeline update that rebuilds "preparation Texts" from "preparation Steps"
+PREPARATION_TEXTS_PIPELINE = [
+    {
+        "$set": {
+            "preparation Texts": {
+                "$map": {
+                    "input": {"$objectToArray": {"$ifNull": ["$preparation Steps", {}]}},
+                    "in": "$$this.v",
+                }
+            }
+        }
+    }
+]
 
 
 class RecipeQueries(MongoDB):
     def __init__(self, uri="mongodb://localhost:27017/", database_name="georgian_cuisine"):
         super().__init__(uri, database_name)
+        self.search_indexes = {}
+
+    @staticmethod
+    def add_preparation_texts(document):
+        """
+        Copies the preparation step texts into a "preparation Texts" array. Preparation
+        steps are stored as a dictionary, which a text index can't reach, so the search
+        indexes this array instead.
+
+        :param document: A dictionary representing the recipe document.
+        :return: A copy of the document with "preparation Texts" set, the given document
+        is left unchanged.
+        """
+        preparation_texts = list((document.get("preparation Steps") or {}).values())
+        return {**document, "preparation Texts": preparation_texts}
+
+    def insert_one(self, collection_name, document):
+        """
+        Insert a single recipe into a collection, together with its searchable
+        preparation texts.
+
+        :param collection_name: The name of the collection.
+        :param document: A dictionary representing the document to be inserted.
+        :return: The result of the insertion.
+        """
+        self.search_indexes.pop(collection_name, None)
+        return super().insert_one(collection_name, self.add_preparation_texts(document))
+
+    def insert_many(self, collection_name, documents):
+        """
+        Insert multiple recipes into a collection, together with their searchable
+        preparation texts.
+
+        :param collection_name: The name of the collection.
+        :param documents: A list of dictionaries representing the documents to be inserted.
+        :return: The result of the insertion.
+        """
+        self.search_indexes.pop(collection_name, None)
+        documents = [self.add_preparation_texts(document) for document in documents]
+        return super().insert_many(collection_name, documents)
+
+    def refresh_preparation_texts(self, collection_name, ids):
+        """
+        Rebuilds "preparation Texts" for the given documents after their preparation steps
+        may have changed.
+
+        :param collection_name: The name of the collection.
+        :param ids: A list of document ids to refresh.
+        :return: The result of the update, or None if an error occurs.
+        """
+        if not ids:
+            return None
+        try:
+            collection = self.get_collection(collection_name)
+            return collection.update_many({"_id": {"$in": ids}}, PREPARATION_TEXTS_PIPELINE)
+        except errors.PyMongoError as e:
+            print(f"Error refreshing preparation texts: {e}")
+            return None
+
+    def update_recipes(self, collection_name, query, update, many):
+        """
+        Applies an update and then rebuilds "preparation Texts" for the updated documents,
+        so the search indexes never keep the old preparation steps.
+
+        :param collection_name: The name of the collection.
+        :param query: A dictionary representing the query to find documents.
+        :param update: A dictionary representing the update to be applied.
+        :param many: Whether to update all matching documents or only the first one.
+        :return: The result of the update operation.
+        """
+        self.search_indexes.pop(collection_name, None)
+        try:
+            collection = self.get_collection(collection_name)
+            matching = collection.find(query, projection={"_id": 1})
+            ids = [document["_id"] for document in (matching if many else matching.limit(1))]
+        except errors.PyMongoError as e:
+            print(f"Error finding documents to update: {e}")
+            return None
+
+        if many:
+            result = super().update_many(collection_name, query, update)
+        else:
+            result = super().update_one(collection_name, query, update)
+        if result is not None:
+            if result.upserted_id is not None:
+                ids.append(result.upserted_id)
+            self.refresh_preparation_texts(collection_name, ids)
+        return result
+
+    def update_one(self, collection_name, query, update):
+        """
+        Update a single recipe that matches the query, keeping its preparation texts in sync.
+
+        :param collection_name: The name of the collection.
+        :param query: A dictionary representing the query to find the document.
+        :param update: A dictionary representing the update to be applied.
+        :return: The result of the update operation.
+        """
+        return self.update_recipes(collection_name, query, update, many=False)
+
+    def update_many(self, collection_name, query, update):
+        """
+        Update multiple recipes that match the query, keeping their preparation texts in sync.
+
+        :param collection_name: The name of the collection.
+        :param query: A dictionary representing the query to find documents.
+        :param update: A dictionary representing the update to be applied.
+        :return: The result of the update operation.
+        """
+        return self.update_recipes(collection_name, query, update, many=True)
+
+    def delete_one(self, collection_name, query):
+        """
+        Delete a single document that matches the query and drop the cached search index.
+
+        :param collection_name: The name of the collection.
+        :param query: A dictionary representing the query.
+        :return: The result of the deletion.
+        """
+        self.search_indexes.pop(collection_name, None)
+        return super().delete_one(collection_name, query)
+
+    def delete_many(self, collection_name, query):
+        """
+        Delete multiple documents that match the query and drop the cached search index.
+
+        :param collection_name: The name of the collection.
+        :param query: A dictionary representing the query.
+        :return: The result of the deletion.
+        """
+        self.search_indexes.pop(collection_name, None)
+        return super().delete_many(collection_name, query)
 
     def avg_ingredients(self, collection_name="recipies"):
         """
@@ -104,3 +259,101 @@ class RecipeQueries(MongoDB):
         except errors.PyMongoError as e:
             print(f"Error finding top author: {e}")
             return None
+
+    def create_text_index(self, collection_name="recipies"):
+        """
+        Creates a weighted text index over the fields in SEARCH_WEIGHTS, the same fields the
+        BM25 fallback indexes. Documents inserted without "preparation Texts" are filled in
+        first. Georgian is not supported by MongoDB stemming, so the language is set to "none".
+
+        :param collection_name: The name of the collection to index (default is "recipes").
+        :return: The name of the created index, or None if an error occurs.
+        """
+        try:
+            collection = self.get_collection(collection_name)
+            collection.update_many(
+                {"preparation Texts": {"$exists": False}}, PREPARATION_TEXTS_PIPELINE
+            )
+            return collection.create_index(
+                [(field, TEXT) for field in SEARCH_WEIGHTS],
+                name="recipe_search",
+                weights=SEARCH_WEIGHTS,
+                default_language="none",
+            )
+        except errors.PyMongoError as e:
+            print(f"Error creating text index: {e}")
+            return None
+
+    def build_search_index(self, collection_name="recipies"):
+        """
+        Builds an in-process BM25 index from the collection, used as a fallback when the
+        text index is not available. The index is cached until documents are inserted,
+        updated or deleted, or the number of documents in the collection changes.
+
+        :param collection_name: The name of the collection to index (default is "recipes").
+        :return: The built BM25Index, or None if an error occurs.
+        """
+        try:
+            collection = self.get_collection(collection_name)
+            fields = ["title", "link", "preparation Steps", *SEARCH_WEIGHTS]
+            cursor = collection.find({}, projection={field: 1 for field in fields})
+            documents = (
+                document if "preparation Texts" in document else self.add_preparation_texts(document)
+                for document in cursor
+            )
+            self.search_indexes[collection_name] = BM25Index.from_cursor(documents, SEARCH_WEIGHTS)
+            return self.search_indexes[collection_name]
+        except errors.PyMongoError as e:
+            print(f"Error building search index: {e}")
+            return None
+
+    def search(self, query, page=1, page_size=10, collection_name="recipies"):
+        """
+        Searches the recipes by title, description, ingredients and preparation steps,
+        ranked by relevance. Uses the MongoDB text index and falls back to the in-process
+        BM25 index if the collection has no text index.
+
+        :param query: The search text.
+        :param page: Page number, starting from 1.
+        :param page_size: Number of results per page.
+        :param collection_name: The name of the collection to query (default is "recipes").
+        :return: A list of dictionaries containing the title, link and score of the matching
+        recipes, best match first, or None if an error occurs or the page arguments are invalid.
+        """
+        if page < 1 or page_size < 1:
+            print(f"Invalid page ({page}) or page size ({page_size}), both must be at least 1")
+            return None
+
+        try:
+            collection = self.get_collection(collection_name)
+            cursor = (
+                collection.find(
+                    {"$text": {"$search": query}},
+                    projection={"title": 1, "link": 1, "score": {"$meta": "textScore"}},
+                )
+                .sort([("score", {"$meta": "textScore"})])
+                .skip((page - 1) * page_size)
+                .limit(page_size)
+            )
+            return list(cursor)
+        except errors.OperationFailure as e:
+            # IndexNotFound, the collection has no text index
+            if e.code != 27:
+                print(f"Error searching recipes: {e}")
+                return None
+            print(f"Text index not found, using BM25 index: {e}")
+        except errors.PyMongoError as e:
+            print(f"Error searching recipes: {e}")
+            return None
+
+        index = self.search_indexes.get(collection_name)
+        try:
+            if index is not None and len(index.documents) != collection.estimated_document_count():
+                index = None
+        except errors.PyMongoError as e:
+            print(f"Error counting recipes: {e}")
+        if index is None:
+            index = self.build_search_index(collection_name)
+        if index is None:
+            return None
+        return index.search(query, page, page_size)
@@ -1,6 +1,7 @@
 import asyncio
 import time
 from data_fetcher import DataFetcher
+from media_fetcher import MediaFetcher
 from scraper import Scraper
 from database.list_to_json import recipes_to_json
 from database.mongo_queries import RecipeQueries
@@ -12,16 +13,18 @@ start = time.perf_counter()
 
 async def main():
     fetcher = DataFetcher()
+    media_fetcher = MediaFetcher()
 
     # inicialize database
     my_db = RecipeQueries()
 
     html = fetcher.fetch_data(url)
-    scraper = Scraper(html, fetcher)
+    scraper = Scraper(html, fetcher, media_fetcher)
     await scraper.get_recipe_info()
 
     # insert data in database
     my_db.insert_many("recipies", scraper.get_recipes())
+    my_db.create_text_index()
 
     # average ingredients for all recipies
     print(f"\n Average ingredients for recipes - {my_db.avg_ingredients()} \n ")
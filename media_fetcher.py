@@ -0,0 +1,249 @@
+import aiohttp
+import asyncio
+import hashlib
+import struct
+from typing import Dict, List, Optional, Tuple
+
+
+class MediaFetcher:
+    """
+    Handles fetching image metadata from the website using aiohttp.
+    Instead of downloading the whole image it sends a HEAD request for
+    the size and content type and a ranged GET for the first bytes of
+    the file, which are enough to read the image dimensions. It uses its
+    own semaphore so media requests don't compete with page requests,
+    and caches the results by URL.
+    """
+
+    def __init__(
+        self, limit: int = 3, header_bytes: int = 32768, timeout: float = 10
+    ) -> None:
+        """
+        Initialize the MediaFetcher class.
+
+        :param limit: int: maximum number of concurrent media requests
+        :param header_bytes: int: number of bytes to request from the
+        start of each image
+        :param timeout: float: total time in seconds allowed for each
+        media request, so a slow image host can't stall the crawl
+        """
+        self.semaphore: asyncio.Semaphore = asyncio.Semaphore(limit)
+        self.header_bytes: int = header_bytes
+        self.timeout: aiohttp.ClientTimeout = aiohttp.ClientTimeout(
+            total=timeout
+        )
+        self.cache: Dict[str, dict] = {}
+
+    @staticmethod
+    def parse_size(size: Optional[str]) -> Optional[int]:
+        """
+        Converts a size header value to an integer.
+
+        :param size: str: header value, e.g. Content-Length
+        :return: int: size in bytes, or None if it is missing or unknown
+        """
+        return int(size) if size and size.isdigit() else None
+
+    async def fetch_head(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> Optional[dict]:
+        """
+        Sends a HEAD request for the image and reads its size and
+        content type from the response headers.
+
+        :param session: aiohttp.ClientSession: aiohttp session object
+        :param url: str: URL of the image
+        :return: dict: size in bytes and content type of the image, or
+        None if the server answers HEAD with an error status (some
+        servers reject HEAD with 405 or 501)
+        """
+        async with session.head(url, allow_redirects=True) as response:
+            if response.status >= 400:
+                return None
+            return {
+                "size": self.parse_size(response.headers.get("Content-Length")),
+                "content_type": response.headers.get("Content-Type"),
+            }
+
+    async def fetch_range(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> Tuple[bytes, dict]:
+        """
+        Fetches the first `header_bytes` bytes of the image with a
+        ranged GET. Servers that ignore the Range header still send
+        the whole body, so the read is capped at `header_bytes`. The
+        read waits for all `header_bytes` bytes, or for the end of the
+        body if the image is smaller, so the result doesn't depend on
+        how the data was split over the network.
+
+        The size and content type are read from the response as well,
+        for servers that don't support HEAD. The size of a 206 response
+        is the total from its Content-Range header.
+
+        :param session: aiohttp.ClientSession: aiohttp session object
+        :param url: str: URL of the image
+        :return: tuple: first bytes of the image, and a dict with the
+        size in bytes and content type of the image
+        :raises aiohttp.ClientResponseError: if the response is not
+        200 or 206
+        """
+        headers = {"Range": f"bytes=0-{self.header_bytes - 1}"}
+        async with session.get(url, headers=headers) as response:
+            response.raise_for_status()
+            if response.status not in (200, 206):
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message="Unexpected status for a ranged GET",
+                )
+            if response.status == 206:
+                content_range = response.headers.get("Content-Range", "")
+                size = self.parse_size(content_range.rpartition("/")[2])
+            else:
+                size = self.parse_size(response.headers.get("Content-Length"))
+            info = {
+                "size": size,
+                "content_type": response.headers.get("Content-Type"),
+            }
+            try:
+                data = await response.content.readexactly(self.header_bytes)
+            except asyncio.IncompleteReadError as e:
+                data = e.partial
+            return data, info
+
+    @staticmethod
+    def parse_dimensions(data: bytes) -> Optional[Tuple[int, int]]:
+        """
+        Reads the width and height of a PNG, GIF, JPEG or WebP image
+        from its first bytes.
+
+        :param data: bytes: first bytes of the image
+        :return: tuple: (width, height), or None if the format is not
+        recognized or the header is incomplete
+        """
+        try:
+            if data.startswith(b"\x89PNG\r\n\x1a\n"):
+                return struct.unpack(">II", data[16:24])
+            if data[:6] in (b"GIF87a", b"GIF89a"):
+                return struct.unpack("<HH", data[6:10])
+            if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+                chunk = data[12:16]
+                if chunk == b"VP8 ":
+                    width, height = struct.unpack("<HH", data[26:30])
+                    return width & 0x3FFF, height & 0x3FFF
+                if chunk == b"VP8L":
+                    bits = int.from_bytes(data[21:25], "little")
+                    return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+                if chunk == b"VP8X":
+                    width = int.from_bytes(data[24:27], "little") + 1
+                    height = int.from_bytes(data[27:30], "little") + 1
+                    return width, height
+                return None
+            if data.startswith(b"\xff\xd8"):
+                index = 2
+                while index + 9 <= len(data):
+                    if data[index] != 0xFF:
+                        index += 1
+                        continue
+                    # Markers may be preceded by any number of 0xFF fill bytes
+                    if data[index + 1] == 0xFF:
+                        index += 1
+                        continue
+                    marker = data[index + 1]
+                    if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+                        index += 2
+                        continue
+                    length = struct.unpack(">H", data[index + 2:index + 4])[0]
+                    # SOF markers, excluding DHT, JPG and DAC
+                    if 0xC0 <= marker <= 0xCF and marker not in (
+                        0xC4, 0xC8, 0xCC
+                    ):
+                        height, width = struct.unpack(
+                            ">HH", data[index + 5:index + 9]
+                        )
+                        return width, height
+                    index += 2 + length
+        except struct.error:
+            return None
+        return None
+
+    @staticmethod
+    def is_image(metadata: dict) -> bool:
+        """
+        Checks whether the content type in the metadata is an image.
+
+        :param metadata: dict: image metadata, or the size and content
+        type from a HEAD or ranged GET response
+        :return: bool: True if the content type is image/*
+        """
+        return (metadata["content_type"] or "").startswith("image/")
+
+    async def fetch_metadata(
+        self, session: aiohttp.ClientSession, url: str
+    ) -> dict:
+        """
+        Fetches the metadata of a single image. Cached results are
+        returned without sending any requests. Failed requests and URLs
+        that don't point to an image are not cached.
+
+        :param session: aiohttp.ClientSession: aiohttp session object
+        :param url: str: URL of the image
+        :return: dict: url, size, content type, width, height and a
+        fingerprint of the first `header_bytes` bytes of the image
+        """
+        if url in self.cache:
+            return self.cache[url]
+
+        metadata = {
+            "url": url,
+            "size": None,
+            "content_type": None,
+            "width": None,
+            "height": None,
+            "fingerprint": None,
+        }
+        async with self.semaphore:
+            try:
+                head = await self.fetch_head(session, url)
+                # Without a HEAD response the ranged GET provides the info
+                if head is None or self.is_image(head):
+                    data, info = await self.fetch_range(session, url)
+                    metadata.update(head or info)
+                else:
+                    metadata.update(head)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Error fetching image metadata for {url}: {e}")
+                return metadata
+
+        if not self.is_image(metadata):
+            print(f"Not an image: {url}")
+            return metadata
+
+        dimensions = self.parse_dimensions(data)
+        if dimensions is not None:
+            metadata["width"], metadata["height"] = dimensions
+        # Only a full prefix, or the whole image, gives a stable fingerprint
+        if len(data) == self.header_bytes or (
+            data and len(data) == metadata["size"]
+        ):
+            metadata["fingerprint"] = hashlib.sha1(data).hexdigest()
+
+        self.cache[url] = metadata
+        return metadata
+
+    async def fetch_metadata_all(self, urls: List[str]) -> List[dict]:
+        """
+        Fetches the metadata of multiple images concurrently, bounded
+        by the semaphore.
+
+        :param urls: List[str]: List of image URLs
+        :return: List[dict]: List of image metadata, in the same order
+        as `urls`
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            tasks = [self.fetch_metadata(session, url) for url in unique_urls]
+            results = await asyncio.gather(*tasks)
+        by_url = dict(zip(unique_urls, results))
+        return [by_url[url] for url in urls]
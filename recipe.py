@@ -1,3 +1,4 @@
+from typing import Optional
 
 
 class Recipe:
@@ -16,6 +17,7 @@ class Recipe:
         portions: int,
         ingredients: list,
         preparation_steps: dict,
+        image_metadata: Optional[dict] = None,
     ) -> None:
         """
         Initializes a Recipe instance.
@@ -26,6 +28,8 @@ class Recipe:
         (e.g., dessert, main course).
         :param subcategory: dict: The subcategory of the recipe.
         :param image_link: str: The URL link to the recipe's image.
+        :param image_metadata: dict: Optional size, dimensions and
+        fingerprint of the recipe's image.
         """
         self.recipe_title: str = recipe_title
         self.recipe_link: str = recipe_link
@@ -37,14 +41,16 @@ class Recipe:
         self.portions: int = portions
         self.ingredients: list = ingredients
         self.preparation_steps: dict = preparation_steps
+        self.image_metadata: Optional[dict] = image_metadata
 
     def to_dict(self) -> dict:
         """
         Converts the Recipe instance into a dictionary format.
 
         :return: dict: A dictionary containing the recipe information.
+        The image metadata is only included when it was fetched.
         """
-        return {
+        recipe = {
             "title": self.recipe_title,
             "link": self.recipe_link,
             "category": self.category,
@@ -56,6 +62,9 @@ class Recipe:
             "ingredients": self.ingredients,
             "preparation Steps": self.preparation_steps,
         }
+        if self.image_metadata is not None:
+            recipe["image metadata"] = self.image_metadata
+        return recipe
 
     def __repr__(self) -> str:
         """
@@ -74,5 +83,6 @@ class Recipe:
             f"Author={self.author}, "
             f"Portions={self.portions}, "
             f"Ingredients={self.ingredients}, "
-            f"Preparation Steps={self.preparation_steps})"
+            f"Preparation Steps={self.preparation_steps}, "
+            f"Image Metadata={self.image_metadata})"
         )
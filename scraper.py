@@ -1,7 +1,9 @@
 from bs4 import BeautifulSoup
 from typing import List, Optional
 from data_fetcher import DataFetcher
+from media_fetcher import MediaFetcher
 from recipe import Recipe
+from text_normalizer import normalize_batch, normalize_text
 
 
 class Scraper:
@@ -11,13 +13,20 @@ class Scraper:
     from each recipe link.
     """
 
-    def __init__(self, html: str, fetcher: DataFetcher) -> None:
+    def __init__(
+        self,
+        html: str,
+        fetcher: DataFetcher,
+        media_fetcher: Optional[MediaFetcher] = None,
+    ) -> None:
         """
         Initialize the Scraper class with the HTML content and
         a DataFetcher instance.
 
         :param html: str: html content of the page
         :param fetcher: DataFetcher: instance of a DataFetcher
+        :param media_fetcher: MediaFetcher: optional instance of a
+        MediaFetcher, if given the image metadata is fetched as well
         """
         self.html: str = html
         self.soup: BeautifulSoup = BeautifulSoup(self.html, "html.parser")
@@ -26,6 +35,7 @@ class Scraper:
         self._urls: List = []
         self._recipes: List = []
         self.fetcher: DataFetcher = fetcher
+        self.media_fetcher: Optional[MediaFetcher] = media_fetcher
         self.get_recipe_links()
 
     @staticmethod
@@ -60,8 +70,9 @@ class Scraper:
         :param default: str: Default text to return if the element has no text
         :return: str: Extracted and cleaned text
         """
-        if len(element.text.strip()) != 0:
-            return element.text.strip()
+        text = element.text.strip()
+        if len(text) != 0:
+            return text
         else:
             return default
 
@@ -97,7 +108,7 @@ class Scraper:
         :return: str: Description of the recipe
         """
         description = soup.find("div", {"class": "post__description"})
-        return self.extract_text(description, "აღწერის გარეშე")
+        return normalize_text(self.extract_text(description, "აღწერის გარეშე"))
 
     def extract_author(self, soup) -> str:
         """
@@ -132,22 +143,16 @@ class Scraper:
     def extract_ingredients(soup) -> List:
         """
         Extracts the list of ingredients from the recipe page.
+        Non-breaking spaces are removed and newlines become spaces.
 
         :param soup: Parsed HTML of the recipe page
         :return: list: List of cleaned ingredient strings
         """
         ingredient_elements = soup.findAll("div", {"class": "list__item"})
-        ingredients = []
-
-        for ingredient in ingredient_elements:
-            text = (
-                ingredient.text.replace("\xa0", "")
-                .replace("\n", "").strip()
-            )
-            cleaned_text = " ".join(text.split())
-            ingredients.append(cleaned_text)
-
-        return ingredients
+        return normalize_batch(
+            [ingredient.text for ingredient in ingredient_elements],
+            drop_nbsp=True,
+        )
 
     def extract_preparation(self, soup) -> dict:
         """
@@ -158,34 +163,36 @@ class Scraper:
         :return: dict: Dictionary where keys are step numbers
         and values are step descriptions
         """
-        preparation_steps = {}
         preparation = soup.find("div", {"class": "lineList"})
         preparation_elements = (
             preparation.findAll("div", {"class": "lineList__item"})
         )
 
+        step_counts = []
+        step_texts = []
         for preparation_element in preparation_elements:
-            preparation_step_count = self.extract_text(
-                preparation_element.find("div", {"class": "count"})
-            )
-            preparation_element_text = (
-                self.extract_text(preparation_element.find("p"))
-                .replace("\n", " ")
-                .replace("\r", "")
-            )
-            preparation_steps[preparation_step_count] = (
-                preparation_element_text
+            step_counts.append(
+                preparation_element.find("div", {"class": "count"}).text
             )
+            step_texts.append(preparation_element.find("p").text)
 
-        return preparation_steps
+        return dict(
+            zip(normalize_batch(step_counts), normalize_batch(step_texts))
+        )
 
     async def get_recipe_info(self) -> None:
         """
         Asynchronously scrapes the recipe information from each recipe link.
         """
         responses = await self.fetcher.fetch_async_all(self._urls)
-        for i, response in enumerate(responses):
-            self.soup_recipe = BeautifulSoup(response, "html.parser")
+        soups = [
+            BeautifulSoup(response, "html.parser") for response in responses
+        ]
+        image_links = [self.extract_image(soup) for soup in soups]
+        images_metadata = await self.get_image_metadata(image_links)
+
+        for i, soup in enumerate(soups):
+            self.soup_recipe = soup
 
             title = self.extract_text(self.soup_recipe.find("h1"))
             recipe_url = self._urls[i]
@@ -197,7 +204,6 @@ class Scraper:
             sub_category = category.find_next_sibling() if category else None
             subcategory_dict = self.extract_category(sub_category)
 
-            image_link = self.extract_image(self.soup_recipe)
             description_result = self.extract_description(self.soup_recipe)
             author_result = self.extract_author(self.soup_recipe)
             int_portion = self.extract_portion(self.soup_recipe)
@@ -209,17 +215,31 @@ class Scraper:
                 recipe_url,
                 category_dict,
                 subcategory_dict,
-                image_link,
+                image_links[i],
                 description_result,
                 author_result,
                 int_portion,
                 ingredients,
-                preparation_steps
+                preparation_steps,
+                images_metadata[i],
             )
 
             self._recipes.append(recipe.to_dict())
             # print(recipe)
 
+    async def get_image_metadata(self, image_links: List[str]) -> List:
+        """
+        Asynchronously fetches the metadata of the recipe images.
+        Without a MediaFetcher no requests are sent.
+
+        :param image_links: List[str]: URLs of the recipe images
+        :return: list: image metadata for each link, or None for each
+        link if no MediaFetcher is configured
+        """
+        if self.media_fetcher is None:
+            return [None] * len(image_links)
+        return await self.media_fetcher.fetch_metadata_all(image_links)
+
     def get_recipes(self) -> List:
         """
         This method is responsible for displaying the _recipes
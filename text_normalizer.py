@@ -0,0 +1,50 @@
+import re
+from typing import List
+
+
+_TOKEN_RE: re.Pattern = re.compile(r"\w+")
+
+
+def normalize_text(text: str, drop_nbsp: bool = False) -> str:
+    """
+    Cleans up a single text in one pass. `str.split` without arguments
+    already treats newlines, carriage returns and non-breaking spaces
+    as whitespace, so every run of them is collapsed into a single space
+    and the result comes out stripped.
+
+    :param text: str: text to normalize
+    :param drop_nbsp: bool: remove non-breaking spaces instead of
+    turning them into a space (ingredient amounts like "200\xa0გრ"
+    are stored as "200გრ")
+    :return: str: normalized text
+    """
+    if drop_nbsp:
+        text = text.replace("\xa0", "")
+    return " ".join(text.split())
+
+
+def normalize_batch(texts: List[str], drop_nbsp: bool = False) -> List[str]:
+    """
+    Normalizes all text nodes of a page at once.
+
+    :param texts: List[str]: texts to normalize
+    :param drop_nbsp: bool: remove non-breaking spaces instead of
+    turning them into a space
+    :return: List[str]: normalized texts, in the same order as `texts`
+    """
+    join = " ".join
+    if drop_nbsp:
+        return [join(text.replace("\xa0", "").split()) for text in texts]
+    return [join(text.split()) for text in texts]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Splits a text into lowercase word tokens for search. Georgian
+    Mtavruli (capital) letters are folded into Mkhedruli, so
+    "ᲮᲐᲭᲐᲞᲣᲠᲘ" and "ხაჭაპური" produce the same token.
+
+    :param text: str: text to tokenize
+    :return: List[str]: list of tokens
+    """
+    return _TOKEN_RE.findall(text.casefold())